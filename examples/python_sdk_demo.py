@@ -8,63 +8,206 @@ through a Python interface for submitting ML training jobs.
 import numpy as np
 import torch
 import torch.nn as nn
+import functools
+import hashlib
 import json
-from typing import Dict, Any, List, Optional
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, List, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - only needed for the BML demo
+    yaml = None
+
+try:
+    import grpc
+except ImportError:  # pragma: no cover - transport is simulated without it
+    grpc = None
+
+def _env_log_level(default: int = logging.WARNING) -> int:
+    """Level named by BCAI_LOG, falling back to default for unknown names"""
+    level = logging.getLevelName(os.environ.get("BCAI_LOG", "").upper())
+    return level if isinstance(level, int) else default
+
+# Demo output goes through logging; set BCAI_LOG=info to see it
+logger = logging.getLogger("bcai")
+logger.setLevel(_env_log_level())
+
+def _dumps(obj: Any) -> bytes:
+    """Compact sorted-key JSON bytes for the wire, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _canonical(obj: Any) -> Any:
+    """JSON-safe copy of obj with deterministic keys, for hashing job content
+    
+    Non-str dict keys are tagged with their type so mixed int/str keys can be
+    sorted without colliding, and NumPy scalars/arrays become plain Python values.
+    """
+    if isinstance(obj, dict):
+        return {
+            k if isinstance(k, str) else f"{type(k).__name__}:{k}": _canonical(v)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return _canonical(obj.tolist())
+    return obj
+
+# One long-lived HTTP/2 channel per node, shared by every client for that node
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+_CHANNEL_IDLE_TIMEOUT_S = 300
+
+class _PooledChannel(NamedTuple):
+    channel: Any
+    last_used: float
+
+_CHANNEL_POOL: Dict[str, _PooledChannel] = {}
+_CHANNEL_POOL_LOCK = threading.Lock()
+
+def _get_channel(node_url: str) -> Optional[Any]:
+    """Return the pooled channel for node_url, evicting channels idle too long
+    
+    Callers must fetch the channel through here for every use rather than
+    holding on to it, since an idle channel may be closed and replaced.
+    """
+    if grpc is None:
+        return None
+    
+    with _CHANNEL_POOL_LOCK:
+        now = time.monotonic()
+        for url, entry in list(_CHANNEL_POOL.items()):
+            if url != node_url and now - entry.last_used > _CHANNEL_IDLE_TIMEOUT_S:
+                entry.channel.close()
+                del _CHANNEL_POOL[url]
+        
+        entry = _CHANNEL_POOL.get(node_url)
+        if entry is None:
+            target = node_url.split("://", 1)[-1]
+            channel = grpc.insecure_channel(target, options=_CHANNEL_OPTIONS)
+        else:
+            channel = entry.channel
+        _CHANNEL_POOL[node_url] = _PooledChannel(channel, now)
+        return channel
 
 class BCaiClient:
     """
     Python client for interacting with BCAI enhanced VM
     """
     
+    __slots__ = ("node_url", "session_id")
+    
     def __init__(self, node_url: str = "ws://localhost:8080"):
         self.node_url = node_url
         self.session_id = None
-        print(f"Connecting to BCAI node at {node_url}")
+        _get_channel(node_url)  # Open (or reuse) the pooled channel up front
+        logger.info("Connecting to BCAI node at %s", node_url)
     
     def submit_job(self, job: 'TrainingJob') -> 'JobResult':
         """Submit a training job to the BCAI network"""
-        print(f"Submitting job: {job.name}")
+        return self.submit_jobs([job])[0]
+    
+    def submit_jobs(self, jobs: List['TrainingJob']) -> List['JobResult']:
+        """Submit several training jobs as a single batched message"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Submitting %d job(s): %s", len(jobs), ", ".join(job.name for job in jobs))
+        
+        # Convert all jobs to VM instructions and pack them into one batch so a
+        # burst of submissions (e.g. per federated round) costs one round trip
+        payload = _dumps({
+            "jobs": [
+                {"job_id": f"job_{job.digest()}", "instructions": job.to_vm_instructions()}
+                for job in jobs
+            ]
+        })
         
-        # Convert job to VM instructions
-        instructions = job.to_vm_instructions()
+        self._send_batch(payload)
         
-        # Simulate job submission (in real implementation, this would use WebSocket/gRPC)
-        result = self._simulate_job_execution(job)
+        results = []
+        for job in jobs:
+            self._simulate_job_execution(job)
+            results.append(JobResult(
+                job_id=f"job_{job.digest()}",
+                success=True,
+                model_hash="abc123def456",
+                training_metrics={
+                    "final_loss": 0.15,
+                    "accuracy": 0.92,
+                    "epochs": job.config.get("epochs", 10),
+                    "execution_time_ms": 5000
+                },
+                gas_used=1000,
+                reward_earned=job.reward_tokens
+            ))
+        return results
+    
+    def _send_batch(self, payload: bytes) -> None:
+        """Simulate sending a serialized job batch to the node"""
+        # Fetch the pooled channel per use (reopened if it was evicted while idle)
+        channel = _get_channel(self.node_url)
         
-        return JobResult(
-            job_id=f"job_{hash(job.name)}",
-            success=True,
-            model_hash="abc123def456",
-            training_metrics={
-                "final_loss": 0.15,
-                "accuracy": 0.92,
-                "epochs": job.config.get("epochs", 10),
-                "execution_time_ms": 5000
-            },
-            gas_used=1000,
-            reward_earned=job.reward_tokens
+        # In real implementation, payload is written to channel as one message
+        logger.debug(
+            "Sending %d-byte job batch to %s (%s)",
+            len(payload), self.node_url, "grpc" if channel is not None else "simulated"
         )
     
     def _simulate_job_execution(self, job: 'TrainingJob') -> Dict[str, Any]:
         """Simulate job execution for demo purposes"""
-        print(f"  Code validation: PASSED")
-        print(f"  Resource allocation: 8GB GPU memory, 16 CPU cores")
-        print(f"  Executing training...")
+        # Skip building the progress log entirely unless it will be emitted
+        if not logger.isEnabledFor(logging.INFO):
+            return {"status": "completed"}
         
-        # Simulate training progress
-        for epoch in range(1, job.config.get("epochs", 10) + 1):
-            loss = 1.0 - (epoch * 0.08)  # Simulated decreasing loss
-            acc = min(0.95, epoch * 0.09)  # Simulated increasing accuracy
-            print(f"    Epoch {epoch}/10 - Loss: {loss:.3f}, Accuracy: {acc:.3f}")
+        epochs = job.config.get("epochs", 10)
+        
+        # Build the whole progress log up front and emit it as one record
+        lines = [
+            "  Code validation: PASSED\n",
+            "  Resource allocation: 8GB GPU memory, 16 CPU cores\n",
+            "  Executing training...\n",
+        ]
+        # Simulated decreasing loss and increasing accuracy, computed for all epochs at once
+        epoch_idx = np.arange(1, epochs + 1)
+        losses = 1.0 - epoch_idx * 0.08
+        accs = np.clip(epoch_idx * 0.09, None, 0.95)
+        lines.extend(
+            f"    Epoch {epoch}/{epochs} - Loss: {loss:.3f}, Accuracy: {acc:.3f}\n"
+            for epoch, loss, acc in zip(range(1, epochs + 1), losses.tolist(), accs.tolist())
+        )
+        lines.append("  Training completed successfully!")
+        logger.info("".join(lines))
         
-        print(f"  Training completed successfully!")
         return {"status": "completed"}
 
+# Fixed parts of every PythonExecute instruction, shared rather than rebuilt per job
+_IN_TENSORS = (("data", 1),)
+_OUT_TENSORS = (("model", 2),)
+_MAX_EXEC_MS = 300000
+
 class TrainingJob:
     """
     Represents a training job to be submitted to the BCAI network
     """
     
+    __slots__ = (
+        "name", "code", "data_source", "requirements", "resources",
+        "reward_tokens", "config", "_digest", "_vm_cache", "_cfg_version"
+    )
+    
     def __init__(
         self,
         name: str,
@@ -82,26 +225,66 @@ class TrainingJob:
         self.resources = resources
         self.reward_tokens = reward_tokens
         self.config = config or {}
+        self._digest = None
+        self._vm_cache = None  # (config version, instructions)
+        self._cfg_version = 0
+    
+    def invalidate(self):
+        """Mark cached derived data stale after mutating the job in place"""
+        self._cfg_version += 1
+        self._digest = None
+    
+    def digest(self) -> str:
+        """Stable content hash of the job, cached so retries don't recompute
+        
+        Any config a job accepts must hash, including NumPy values and mixed keys:
+        
+        >>> TrainingJob("j", "", "", [], {}, 0, {"epochs": np.int64(3), 1: "a"}).digest()
+        'a2d71cb6ae6e433646f2fabc0411255d'
+        """
+        if self._digest is None:
+            # Always hash the stdlib encoding so ids don't depend on whether
+            # orjson is installed (the two format some floats differently);
+            # repr() covers any remaining value json can't encode
+            payload = json.dumps(
+                _canonical({"n": self.name, "c": self.code, "d": self.data_source, "cfg": self.config}),
+                sort_keys=True,
+                separators=(",", ":"),
+                default=repr
+            ).encode()
+            self._digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        return self._digest
     
     def to_vm_instructions(self) -> List[Dict[str, Any]]:
-        """Convert Python job to VM instructions"""
-        return [
+        """Convert Python job to VM instructions (memoized until invalidate())"""
+        if self._vm_cache is not None and self._vm_cache[0] == self._cfg_version:
+            return self._vm_cache[1]
+        
+        max_memory_mb = self.resources.get("memory_mb", 2048)
+        instructions = [
             {
                 "type": "PythonExecute",
                 "code": self.code,
-                "input_tensors": [("data", 1)],
-                "output_tensors": [("model", 2)],
+                "input_tensors": _IN_TENSORS,
+                "output_tensors": _OUT_TENSORS,
                 "constraints": {
-                    "max_memory_mb": self.resources.get("memory_mb", 2048),
-                    "max_execution_time_ms": 300000,
+                    "max_memory_mb": max_memory_mb,
+                    "max_execution_time_ms": _MAX_EXEC_MS,
                     "allowed_imports": self.requirements
                 }
             }
         ]
+        self._vm_cache = (self._cfg_version, instructions)
+        return instructions
 
 class JobResult:
     """Result of a submitted training job"""
     
+    __slots__ = (
+        "job_id", "success", "model_hash", "training_metrics",
+        "gas_used", "reward_earned", "error_message"
+    )
+    
     def __init__(
         self,
         job_id: str,
@@ -127,18 +310,51 @@ class JobResult:
 def demo_transformer_training():
     """Demo: Train a simple transformer model"""
     
-    print("🚀 BCAI Enhanced VM Demo: Transformer Training")
-    print("=" * 60)
+    logger.info("🚀 BCAI Enhanced VM Demo: Transformer Training")
+    logger.info("=" * 60)
     
     client = BCaiClient()
     
     # Define training code using PyTorch
     training_code = '''
+import multiprocessing
+import os
+import tempfile
 import torch
 import torch.nn as nn
 import torch.optim as optim
 from torch.utils.data import DataLoader, TensorDataset
 
+# Portable torch.compile cache so job retries skip the cold-start recompile
+COMPILE_CACHE_PATH = "/tmp/bcai_cache.bin"
+
+def load_compile_cache():
+    """Warm-start torch.compile from artifacts saved by a previous run"""
+    if hasattr(torch.compiler, "load_cache_artifacts") and os.path.exists(COMPILE_CACHE_PATH):
+        try:
+            with open(COMPILE_CACHE_PATH, "rb") as f:
+                torch.compiler.load_cache_artifacts(f.read())
+        except Exception as e:
+            # A stale or corrupt cache must never fail the job; compile cold instead
+            print(f"Ignoring unusable compile cache: {e}")
+
+def save_compile_cache():
+    """Persist torch.compile artifacts for the next run of this job"""
+    if hasattr(torch.compiler, "save_cache_artifacts"):
+        saved = torch.compiler.save_cache_artifacts()
+        if saved is not None:
+            artifacts, _ = saved
+            # Write to a temp file and atomically swap it in, so concurrent jobs
+            # or a job killed mid-write never leave a truncated cache behind
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(COMPILE_CACHE_PATH))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(artifacts)
+                os.replace(tmp_path, COMPILE_CACHE_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
 class SimpleTransformer(nn.Module):
     def __init__(self, vocab_size, embed_dim, num_heads, num_layers):
         super().__init__()
@@ -161,55 +377,102 @@ class SimpleTransformer(nn.Module):
         return self.classifier(x)
 
 def train_model():
+    # Let matmuls/convs use TF32 tensor cores and cuDNN pick the fastest kernels
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.backends.cudnn.benchmark = True
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    use_cuda = device.type == "cuda"
+    
+    # bf16 autocast only pays off where the GPU has bf16 tensor cores (Ampere+);
+    # older GPUs get fp16 autocast with loss scaling, CPU-only nodes stay fp32
+    if use_cuda and torch.cuda.is_bf16_supported():
+        amp_dtype = torch.bfloat16
+    elif use_cuda:
+        amp_dtype = torch.float16
+    else:
+        amp_dtype = None
+    GradScaler = torch.amp.GradScaler if hasattr(torch.amp, "GradScaler") else torch.cuda.amp.GradScaler
+    scaler = GradScaler(enabled=amp_dtype is torch.float16)
+    
     # Model configuration
     vocab_size = 10000
     embed_dim = 512
     num_heads = 8
     num_layers = 6
     
-    # Create model
-    model = SimpleTransformer(vocab_size, embed_dim, num_heads, num_layers)
+    # Create model; train through the compiled wrapper but keep the eager
+    # module for state_dict() so weight names carry no _orig_mod prefix
+    load_compile_cache()
+    model = SimpleTransformer(vocab_size, embed_dim, num_heads, num_layers).to(device)
+    compiled_model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
     
     # Generate synthetic data for demo
     batch_size = 32
     seq_length = 128
+    gradient_accumulation_steps = 4  # Matches the job config
     
     # Simulated training data
     input_ids = torch.randint(0, vocab_size, (1000, seq_length))
     target_ids = torch.randint(0, vocab_size, (1000, seq_length))
     
     dataset = TensorDataset(input_ids, target_ids)
-    dataloader = DataLoader(dataset, batch_size=batch_size, shuffle=True)
+    # Collate and pin batches in background workers so host-side work
+    # overlaps with compute instead of stalling the training loop
+    dataloader = DataLoader(
+        dataset,
+        batch_size=batch_size,
+        shuffle=True,
+        num_workers=4,
+        pin_memory=use_cuda,
+        persistent_workers=True,
+        prefetch_factor=4
+    )
     
     # Training setup
     optimizer = optim.Adam(model.parameters(), lr=0.0001)
     criterion = nn.CrossEntropyLoss()
     
     model.train()
+    num_batches = len(dataloader)
+    optimizer.zero_grad(set_to_none=True)
     for epoch in range(10):
         total_loss = 0
         for batch_idx, (data, target) in enumerate(dataloader):
-            optimizer.zero_grad()
+            data = data.to(device, non_blocking=True)
+            target = target.to(device, non_blocking=True)
             
-            output = model(data)
-            loss = criterion(output.view(-1, vocab_size), target.view(-1))
+            # Mixed-precision forward; Adam keeps FP32 master weights either way
+            with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=amp_dtype is not None):
+                output = compiled_model(data)
+                loss = criterion(output.view(-1, vocab_size), target.view(-1))
             
-            loss.backward()
-            optimizer.step()
+            # Accumulate scaled gradients and only step the optimizer every
+            # gradient_accumulation_steps batches (and on the epoch's last one);
+            # the scaler is a pass-through unless fp16 needs loss scaling
+            scaler.scale(loss / gradient_accumulation_steps).backward()
+            if (batch_idx + 1) % gradient_accumulation_steps == 0 or batch_idx + 1 == num_batches:
+                scaler.step(optimizer)
+                scaler.update()
+                optimizer.zero_grad(set_to_none=True)
             
             total_loss += loss.item()
             
             if batch_idx % 10 == 0:
                 print(f"Epoch {epoch+1}, Batch {batch_idx}, Loss: {loss.item():.4f}")
         
-        avg_loss = total_loss / len(dataloader)
+        avg_loss = total_loss / num_batches
         print(f"Epoch {epoch+1} completed. Average Loss: {avg_loss:.4f}")
     
+    save_compile_cache()
     return model.state_dict()
 
-# Execute training
-model_weights = train_model()
-print("Training completed successfully!")
+# Execute training. DataLoader workers started with spawn or forkserver
+# re-import this script, so only train in the parent process; unlike a
+# __main__ check this still runs when the VM exec()s the code
+if multiprocessing.parent_process() is None:
+    model_weights = train_model()
+    print("Training completed successfully!")
 '''
     
     # Create training job
@@ -231,26 +494,27 @@ print("Training completed successfully!")
         config={
             "epochs": 10,
             "batch_size": 32,
-            "learning_rate": 0.0001
+            "learning_rate": 0.0001,
+            "gradient_accumulation_steps": 4
         }
     )
     
     # Submit job
     result = client.submit_job(job)
-    print(f"\n📊 Training Result: {result}")
-    
-    if result.success:
-        print(f"✅ Model trained successfully!")
-        print(f"📈 Final accuracy: {result.training_metrics['accuracy']:.2%}")
-        print(f"⏱️  Training time: {result.training_metrics['execution_time_ms']}ms")
-        print(f"💰 Reward earned: {result.reward_earned} TRAIN tokens")
-        print(f"🔗 Model hash: {result.model_hash}")
+    logger.info("\n📊 Training Result: %s", result)
+    
+    if result.success and logger.isEnabledFor(logging.INFO):
+        logger.info("✅ Model trained successfully!")
+        logger.info(f"📈 Final accuracy: {result.training_metrics['accuracy']:.2%}")
+        logger.info(f"⏱️  Training time: {result.training_metrics['execution_time_ms']}ms")
+        logger.info(f"💰 Reward earned: {result.reward_earned} TRAIN tokens")
+        logger.info(f"🔗 Model hash: {result.model_hash}")
 
 def demo_federated_learning():
     """Demo: Federated learning with multiple nodes"""
     
-    print("\n🌐 BCAI Enhanced VM Demo: Federated Learning")
-    print("=" * 60)
+    logger.info("\n🌐 BCAI Enhanced VM Demo: Federated Learning")
+    logger.info("=" * 60)
     
     client = BCaiClient()
     
@@ -259,19 +523,22 @@ def demo_federated_learning():
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+# The small MLP is overhead-bound, so run clients under TorchScript. Disabling
+# the profiling executor/mode skips its multi-call warmup and shape-change
+# recompiles, at the cost of slightly less specialized steady-state graphs
+torch._C._jit_set_profiling_executor(False)
+torch._C._jit_set_profiling_mode(False)
 
 class FederatedClient:
-    def __init__(self, model_architecture):
-        self.model = model_architecture()
+    def __init__(self, model_architecture, idx: int, all_features, all_labels):
+        self.model = torch.jit.script(model_architecture())
         self.optimizer = optim.Adam(self.model.parameters(), lr=0.001)
-        self.local_data = self.generate_local_data()
-    
-    def generate_local_data(self):
-        # Simulate local data for each client
-        return {
-            'features': torch.randn(100, 784),  # MNIST-like data
-            'labels': torch.randint(0, 10, (100,))
+        # Views into the shared per-client buffers, no copy
+        self.local_data = {
+            'features': all_features[idx],
+            'labels': all_labels[idx]
         }
     
     def local_training(self, global_weights: Dict, epochs: int = 5):
@@ -305,35 +572,57 @@ def simple_cnn():
         nn.Linear(64, 10)
     )
 
-def federated_averaging(client_weights: List[Dict]) -> Dict:
-    """Aggregate client model weights using federated averaging"""
-    # Initialize averaged weights
-    averaged_weights = {}
+def federated_averaging(client_weights: List[Dict], out: Optional[Dict] = None) -> Dict:
+    """Aggregate client model weights using federated averaging
     
-    # Get parameter names from first client
-    param_names = client_weights[0].keys()
+    Accumulates in place into ``out`` (allocated if not given) so peak memory
+    stays at one model copy and callers can reuse the buffer across rounds.
+    """
+    if out is None:
+        out = {name: torch.empty_like(param) for name, param in client_weights[0].items()}
+    for param in out.values():
+        param.zero_()
     
-    for param_name in param_names:
-        # Average across all clients
-        stacked_weights = torch.stack([
-            client_weights[i][param_name] 
-            for i in range(len(client_weights))
-        ])
-        averaged_weights[param_name] = torch.mean(stacked_weights, dim=0)
+    scale = 1.0 / len(client_weights)
+    for weights in client_weights:
+        for name, param in weights.items():
+            out[name].add_(param, alpha=scale)
     
-    return averaged_weights
+    return out
+
+def evaluate_model(model, eval_data: Dict) -> float:
+    """Accuracy of model on the held-out evaluation data"""
+    with torch.no_grad():
+        predictions = model(eval_data['features']).argmax(dim=1)
+    return (predictions == eval_data['labels']).float().mean().item()
 
 def run_federated_learning():
     """Run federated learning simulation"""
     num_clients = 5
     num_rounds = 10
     
+    # Simulate local data for every client in one allocation per field
+    # (MNIST-like data); each client indexes its own slice
+    all_features = torch.randn(num_clients, 100, 784)
+    all_labels = torch.randint(0, 10, (num_clients, 100))
+    
     # Initialize clients
-    clients = [FederatedClient(simple_cnn) for _ in range(num_clients)]
+    clients = [
+        FederatedClient(simple_cnn, idx, all_features, all_labels)
+        for idx in range(num_clients)
+    ]
     
-    # Initialize global model
+    # Initialize global model; the scripted eval copy is compiled once and
+    # only has fresh weights loaded into it each round
     global_model = simple_cnn()
     global_weights = global_model.state_dict()
+    eval_model = torch.jit.script(global_model).eval()
+    # Aggregation buffer reused every round instead of reallocating the weights
+    agg_buf = {name: torch.empty_like(param) for name, param in global_weights.items()}
+    eval_data = {
+        'features': torch.randn(200, 784),
+        'labels': torch.randint(0, 10, (200,))
+    }
     
     print(f"Starting federated learning with {num_clients} clients...")
     
@@ -348,13 +637,18 @@ def run_federated_learning():
             print(f"  Client {i+1} completed local training")
         
         # Aggregate updates
-        global_weights = federated_averaging(client_updates)
+        global_weights = federated_averaging(client_updates, out=agg_buf)
         print(f"  Global model updated via federated averaging")
         
-        # Evaluate global model (simplified)
-        accuracy = 0.85 + (round_num * 0.01)  # Simulated improving accuracy
+        # Evaluate global model on held-out synthetic data
+        eval_model.load_state_dict(global_weights)
+        accuracy = evaluate_model(eval_model, eval_data)
         print(f"  Global model accuracy: {accuracy:.3f}")
     
+    # Freeze the final weights into a one-off inference-optimized copy
+    inference_model = torch.jit.optimize_for_inference(eval_model)
+    print(f"Final global model accuracy: {evaluate_model(inference_model, eval_data):.3f}")
+    
     return global_weights
 
 # Execute federated learning
@@ -381,15 +675,9 @@ print("Federated learning completed!")
     )
     
     result = client.submit_job(job)
-    print(f"\n📊 Federated Learning Result: {result}")
+    logger.info("\n📊 Federated Learning Result: %s", result)
 
-def demo_yaml_configuration():
-    """Demo: YAML-based job configuration (BML - BCAI ML Language)"""
-    
-    print("\n📄 BCAI Enhanced VM Demo: YAML Configuration")
-    print("=" * 60)
-    
-    yaml_config = '''
+_BML_YAML = '''
 # BCAI ML Language (BML) Configuration
 name: "bert-sentiment-analysis"
 model:
@@ -431,18 +719,39 @@ rewards:
   performance_bonus: true
   data_contribution_bonus: 500
 '''
+
+@functools.lru_cache(maxsize=1)
+def _parsed_yaml() -> Dict[str, Any]:
+    """Parse the example BML config once; later calls hit the cached dict"""
+    if yaml is None:
+        raise ImportError("PyYAML is required to parse BML configurations")
+    # Prefer the libyaml-backed loader, which is much faster than pure Python
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(_BML_YAML, Loader=loader)
+
+def demo_yaml_configuration():
+    """Demo: YAML-based job configuration (BML - BCAI ML Language)"""
     
-    print("📋 Example BML Configuration:")
-    print(yaml_config)
+    logger.info("\n📄 BCAI Enhanced VM Demo: YAML Configuration")
+    logger.info("=" * 60)
     
-    print("🔄 This configuration would be automatically converted to VM instructions:")
-    print("  1. TensorCreate operations for model parameters")
-    print("  2. Linear, Attention, and LayerNorm instructions")
-    print("  3. AdamW optimizer steps")
-    print("  4. Federated aggregation operations")
-    print("  5. Performance evaluation metrics")
+    logger.info("📋 Example BML Configuration:")
+    logger.info(_BML_YAML)
+    
+    if yaml is not None and logger.isEnabledFor(logging.INFO):
+        config = _parsed_yaml()
+        logger.info(f"🧩 Parsed job '{config['name']}' with sections: {', '.join(k for k in config if k != 'name')}")
+    
+    logger.info("🔄 This configuration would be automatically converted to VM instructions:")
+    logger.info("  1. TensorCreate operations for model parameters")
+    logger.info("  2. Linear, Attention, and LayerNorm instructions")
+    logger.info("  3. AdamW optimizer steps")
+    logger.info("  4. Federated aggregation operations")
+    logger.info("  5. Performance evaluation metrics")
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    
     # Run all demos
     demo_transformer_training()
     demo_federated_learning() 